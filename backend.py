@@ -1,63 +1,300 @@
+import glob
+import hashlib
+import json
 import os
-from qiskit.providers.aer import AerSimulator
+import pickle
+import re
+import threading
+import time
+from collections.abc import KeysView
+from qiskit.providers.aer import AerError, AerSimulator
 from qiskit.providers.backend import BackendV1
 from qiskit.providers.aer.noise import NoiseModel, depolarizing_error, pauli_error
 
 # Attempt IBMQ import; if unavailable, skip real-device backends
 try:
     from qiskit_ibm_provider import IBMQ
+    from qiskit_ibm_provider.exceptions import IBMError
+    from requests.exceptions import RequestException
 except ImportError:
     IBMQ = None
 
+from cache import CACHE_DIR
+
+BACKENDS_CACHE = os.path.join(CACHE_DIR, "backends.json")
+BACKENDS_TTL = 24 * 3600
+PROPS_REFRESH = 6 * 3600
+
+# Combobox labels served by the shared simulator, with the method each selects
+AER_METHODS = {"Aer (statevector)": "statevector", "Aer (qasm)": "automatic"}
+
 
 class BackendManager:
-    def __init__(self, ibm_api_token: str = None, ibm_hub: str = None, ibm_group: str = None, ibm_project: str = None):
+    __slots__ = ('backends', 'noise_models', 'active_backend', 'gpu_available', '_aer', '_credentials',
+                 '_provider', '_noise_keys', '_props', '_props_timers')
+
+    def __init__(self, ibm_api_token: str = None, ibm_hub: str = None, ibm_group: str = None, ibm_project: str = None,
+                 gpu_available: bool = None):
         self.backends = {}
         self.noise_models = {}
-        # Load Aer simulators
-        self.backends["Aer (statevector)"] = AerSimulator(method='statevector')
-        self.backends["Aer (qasm)"] = AerSimulator(method='qasm')
-        # Attempt to load IBMQ backends if provider is available and token given
-        if IBMQ and ibm_api_token:
+        self._noise_keys = {}
+        self._props = {}
+        self._props_timers = {}
+        # One simulator backs every Aer entry; set_backend picks the method.
+        # When gpu_available is already known (pool workers) skip the probe and start on the CPU,
+        # so no GPU context is created until set_gpu(True) asks for one.
+        if gpu_available is None:
             try:
-                IBMQ.save_account(ibm_api_token, overwrite=True)
-                IBMQ.load_account()
-                provider = IBMQ.get_provider(hub=ibm_hub, group=ibm_group, project=ibm_project)
+                self._aer = AerSimulator(device='GPU', precision='single')
+                gpu_available = True
+            except AerError:
+                self._aer = AerSimulator()
+                gpu_available = False
+        else:
+            self._aer = AerSimulator()
+        self.gpu_available = gpu_available
+        for name in AER_METHODS:
+            self.backends[name] = self._aer
+        # IBMQ backends are loaded later by refresh_ibmq so startup never waits on the network
+        self._credentials = (ibm_api_token, ibm_hub, ibm_group, ibm_project)
+        self._provider = None
+        # Default active backend
+        self.active_backend = self.set_backend("Aer (statevector)")
+
+    def refresh_ibmq(self, callback=None):
+        # Cheap capability check: without the provider or a token there is nothing to load
+        if not (IBMQ and self._credentials[0]):
+            return
+        # callback receives the loaded backends and should apply them with add_backends on the
+        # thread that owns this manager; without one they are added from the loader thread
+        threading.Thread(target=self._load_ibmq, args=(callback or self.add_backends,), daemon=True).start()
+
+    def add_backends(self, found: dict):
+        self.backends.update(found)
+
+    @property
+    def credentials(self) -> tuple:
+        return self._credentials
+
+    def add_ibmq_backend(self, name: str):
+        # Registers one device by label without enumerating the provider; used by pool workers,
+        # which never run refresh_ibmq. The device itself is resolved on first set_backend.
+        ibm_api_token, ibm_hub, ibm_group, ibm_project = self._credentials
+        if not (IBMQ and ibm_api_token and name.startswith("IBM ")):
+            raise ValueError(f"Backend '{name}' not available.")
+        if self._provider is None:
+            self._provider = IBMQ.enable_account(ibm_api_token, hub=ibm_hub, group=ibm_group, project=ibm_project)
+        self.backends.setdefault(name, None)
+
+    def _load_ibmq(self, callback):
+        ibm_api_token, ibm_hub, ibm_group, ibm_project = self._credentials
+        try:
+            IBMQ.save_account(ibm_api_token, overwrite=True)
+            IBMQ.load_account()
+            provider = IBMQ.get_provider(hub=ibm_hub, group=ibm_group, project=ibm_project)
+            self._provider = provider
+            account = self._account_key()
+            names = self._read_backends_cache(account)
+            if names is not None:
+                # Resolved on first selection in set_backend
+                found = {f"IBM {n}": None for n in names}
+            else:
+                found = {}
                 for b in provider.backends():
                     if not b.configuration().simulator:
-                        self.backends[f"IBM {b.name()}"] = b
-            except Exception:
-                # Silently ignore IBMQ errors
-                pass
-        # Default active backend
-        self.active_backend = self.backends["Aer (statevector)"]
+                        found[f"IBM {b.name()}"] = b
+                self._write_backends_cache(account, [k[len("IBM "):] for k in found])
+        except (IBMError, RequestException):
+            # Account or network trouble leaves the simulators as the only backends
+            return
+        callback(found)
 
-    def list_backends(self) -> list:
-        return list(self.backends.keys())
+    def _account_key(self) -> str:
+        # The cached device list is only valid for the token/hub/group/project that produced it
+        return hashlib.blake2b(repr(self._credentials).encode(), digest_size=16).hexdigest()
 
-    def set_backend(self, name: str) -> BackendV1:
+    @staticmethod
+    def _read_backends_cache(account):
+        try:
+            with open(BACKENDS_CACHE) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("backends"), list):
+            return None
+        if data.get("account") != account or time.time() - data.get("timestamp", 0) > BACKENDS_TTL:
+            return None
+        return data.get("backends")
+
+    @staticmethod
+    def _write_backends_cache(account, names):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(BACKENDS_CACHE, "w") as f:
+                json.dump({"account": account, "timestamp": time.time(), "backends": names}, f)
+        except OSError:
+            # Only saves the next launch a round-trip; the device list is still returned
+            pass
+
+    def list_backends(self) -> KeysView:
+        # Live view; callers that need a snapshot should copy it
+        return self.backends.keys()
+
+    def _resolve(self, name: str) -> BackendV1:
         if name not in self.backends:
             raise ValueError(f"Backend '{name}' not available.")
-        self.active_backend = self.backends[name]
+        if self.backends[name] is None:
+            self.backends[name] = self._provider.get_backend(name[len("IBM "):])
+        return self.backends[name]
+
+    def set_backend(self, name: str) -> BackendV1:
+        backend = self._resolve(name)
+        if name in AER_METHODS:
+            backend.set_options(method=AER_METHODS[name])
+        self.active_backend = backend
         return self.active_backend
 
+    def set_gpu(self, enabled: bool):
+        if enabled and not self.gpu_available:
+            raise ValueError("No GPU device available to Aer.")
+        if enabled:
+            self._aer.set_options(device='GPU', precision='single')
+        else:
+            self._aer.set_options(device='CPU', precision='double')
+
     def get_backend(self) -> BackendV1:
         return self.active_backend
 
     def create_noise_model(self, backend_name: str) -> NoiseModel:
-        if backend_name not in self.backends:
-            raise ValueError(f"Backend '{backend_name}' not available.")
-        backend = self.backends[backend_name]
+        self._resolve(backend_name)  # unknown names raise ValueError rather than yield an empty model
+        try:
+            props = self.properties(backend_name)
+        except Exception:
+            props = None
+        # Keyed on calibration time so a model is only re-derived after IBM recalibrates
+        key = (backend_name, self._stamp(props))
+        nm = self.noise_models.get(key)
+        if nm is None:
+            nm = self._load_noise_model(key, props)
+            self.noise_models[key] = nm
+        self._noise_keys[backend_name] = key
+        return nm
+
+    def calibration_stamp(self, backend_name: str) -> str:
+        self._resolve(backend_name)
+        try:
+            props = self.properties(backend_name)
+        except Exception:
+            # Offline: key on the newest snapshot however old, or on no calibration at all
+            props = self._read_props(backend_name, max_age=None)
+        return self._stamp(props)
+
+    def properties(self, backend_name: str):
+        # Memory, then a recent on-disk snapshot, and only then the network
+        props = self._props.get(backend_name)
+        if props is None:
+            props = self._read_props(backend_name)
+            if props is not None:
+                self._props[backend_name] = props
+                self._schedule_props_refresh(backend_name)
+        if props is None:
+            props = self._fetch_props(backend_name)
+        return props
+
+    def _fetch_props(self, backend_name: str):
+        props = self._resolve(backend_name).properties()
+        if props is None:
+            return None
+        self._props[backend_name] = props
+        self._write_snapshot("props", backend_name, re.sub(r'\W+', '_', self._stamp(props)), props)
+        self._schedule_props_refresh(backend_name)
+        return props
+
+    def _read_props(self, backend_name: str, max_age=PROPS_REFRESH):
+        paths = self._snapshot_paths("props", backend_name)
+        if not paths:
+            return None
+        try:
+            latest = max(paths, key=os.path.getmtime)
+            if max_age is not None and time.time() - os.path.getmtime(latest) > max_age:
+                return None
+            with open(latest, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Unreadable or written by another qiskit version: treat as a miss
+            return None
+
+    def _schedule_props_refresh(self, backend_name: str):
+        if backend_name in self._props_timers:
+            return
+        timer = threading.Timer(PROPS_REFRESH, self._refresh_props, args=(backend_name,))
+        timer.daemon = True
+        self._props_timers[backend_name] = timer
+        timer.start()
+
+    def _refresh_props(self, backend_name: str):
+        del self._props_timers[backend_name]
+        try:
+            self._fetch_props(backend_name)
+        except Exception:
+            # Keep serving the last snapshot and try again next period
+            self._schedule_props_refresh(backend_name)
+
+    @staticmethod
+    def _file_tag(backend_name: str) -> str:
+        # Tags never contain '-', so the separator keeps one backend's glob from matching another's
+        return re.sub(r'\W+', '_', backend_name)
+
+    @classmethod
+    def _snapshot_path(cls, kind: str, backend_name: str, suffix: str) -> str:
+        return os.path.join(CACHE_DIR, f"{kind}_{cls._file_tag(backend_name)}-{suffix}.pkl")
+
+    @classmethod
+    def _snapshot_paths(cls, kind: str, backend_name: str) -> list:
+        return glob.glob(cls._snapshot_path(kind, backend_name, "*"))
+
+    @classmethod
+    def _write_snapshot(cls, kind: str, backend_name: str, suffix: str, obj):
+        # Snapshots are only an optimisation: failures are ignored, and older ones for the backend are pruned
+        path = cls._snapshot_path(kind, backend_name, suffix)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump(obj, f)
+        except (OSError, pickle.PicklingError):
+            return
+        for old in cls._snapshot_paths(kind, backend_name):
+            if old != path:
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _stamp(props) -> str:
+        return str(props.last_update_date) if props is not None else ""
+
+    @classmethod
+    def _load_noise_model(cls, key, props) -> NoiseModel:
+        backend_name, _ = key
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        path = cls._snapshot_path("nm", backend_name, digest)
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Missing, truncated or pickled by another qiskit-aer version: rebuild it
+            pass
         try:
-            props = backend.properties()
             nm = NoiseModel.from_backend(props)
         except Exception:
-            nm = NoiseModel()
-        self.noise_models[backend_name] = nm
+            return NoiseModel()
+        cls._write_snapshot("nm", backend_name, digest, nm)
         return nm
 
     def get_noise_model(self, backend_name: str) -> NoiseModel:
-        return self.noise_models.get(backend_name, NoiseModel())
+        key = self._noise_keys.get(backend_name)
+        return self.noise_models.get(key, NoiseModel())
 
     @staticmethod
     def sample_depolarizing(p: float) -> NoiseModel:
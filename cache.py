@@ -0,0 +1,62 @@
+import dbm
+import hashlib
+import io
+import os
+import shelve
+import threading
+
+from qiskit import qpy
+
+CACHE_DIR = os.path.expanduser("~/.qtranspile")
+
+# Bump whenever the per-level pipeline changes so rows produced by the old one are not served
+PIPELINE_VERSION = 2
+
+
+def _circuit_bytes(qc) -> bytes:
+    try:
+        return qc.qasm().encode()
+    except Exception:
+        # Simulator-only instructions (e.g. save_statevector) have no QASM form
+        buf = io.BytesIO()
+        qpy.dump(qc, buf)
+        return buf.getvalue()
+
+
+class TranspileCache:
+    """On-disk store of analysis rows keyed by circuit, backend, calibration and level."""
+
+    __slots__ = ('path', '_lock')
+
+    def __init__(self, path: str = None):
+        if path is None:
+            path = os.path.join(CACHE_DIR, "transpile")
+        self.path = path
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(qc, backend_name: str, calibration: str, level: int) -> str:
+        h = hashlib.blake2b(_circuit_bytes(qc))
+        h.update(str(PIPELINE_VERSION).encode())
+        h.update(backend_name.encode())
+        h.update(str(calibration).encode())
+        h.update(str(level).encode())
+        return h.hexdigest()
+
+    # The cache is only an optimisation: unreadable or unwritable stores behave like misses
+
+    def get(self, key: str):
+        try:
+            with self._lock, shelve.open(self.path) as db:
+                return db.get(key)
+        except Exception:
+            return None
+
+    def put(self, key: str, row: dict):
+        try:
+            with self._lock:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with shelve.open(self.path) as db:
+                    db[key] = row
+        except (OSError, *dbm.error):
+            pass
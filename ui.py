@@ -1,15 +1,83 @@
 #!/usr/bin/env python3
+import functools
+import itertools
+import multiprocessing
+import os
+import queue
 import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.transpiler import PassManager, PassManagerConfig
+from qiskit.transpiler.preset_passmanagers import level_0_pass_manager
+
 from builder import CircuitBuilder
-from backend import BackendManager
+from backend import AER_METHODS, BackendManager
+from cache import TranspileCache
 from analyzer import analyze_transpile, default_pass_manager
 from reporting import ReportGenerator
 
+# Attempt tksheet import; if unavailable, fall back to a ttk.Treeview results table
+try:
+    from tksheet import Sheet
+except ImportError:
+    Sheet = None
+
+
+@functools.lru_cache(maxsize=32)
+def _pass_manager(basis_gates):
+    return default_pass_manager(list(basis_gates))
+
+
+@functools.lru_cache(maxsize=32)
+def _level_0_pass_manager(basis_gates):
+    # Built explicitly so a level-0 request never falls through to the full default pipeline
+    return level_0_pass_manager(PassManagerConfig(basis_gates=list(basis_gates)))
+
+
+_worker_backend_mgr = None
+
+
+def _init_worker(credentials, gpu_available, gate_sets):
+    # Pool initializer: build this worker's backends and pass managers before the first batch arrives.
+    # The GPU was probed once in the app, so workers only touch it for runs that ask for it.
+    global _worker_backend_mgr
+    _worker_backend_mgr = BackendManager(*credentials, gpu_available=gpu_available)
+    for gates in gate_sets:
+        _level_0_pass_manager(gates)
+        _pass_manager(gates)
+
+
+def _run_levels(qc, backend_name, levels, basis_gates, simulator=False, gpu=False):
+    # Runs in a pool worker: backends are not picklable, so resolve by name
+    if backend_name not in _worker_backend_mgr.backends:
+        # IBM devices are only listed in the app's manager; connect this worker with the same account
+        _worker_backend_mgr.add_ibmq_backend(backend_name)
+    if _worker_backend_mgr.gpu_available:
+        _worker_backend_mgr.set_gpu(gpu)
+    backend = _worker_backend_mgr.set_backend(backend_name)
+    # Simulators have no coupling constraints, so there is nothing to transpile for
+    if simulator:
+        return analyze_transpile(qc, backend, levels, PassManager())
+    # One analyze_transpile call per pass manager, so levels sharing one are analysed together
+    gates = tuple(sorted(basis_gates))
+    rows = []
+    if 0 in levels:
+        rows += analyze_transpile(qc, backend, [0], _level_0_pass_manager(gates))
+    rest = [level for level in levels if level != 0]
+    if rest:
+        rows += analyze_transpile(qc, backend, rest, _pass_manager(gates))
+    return rows
+
 
 class QTranspileApp(tk.Tk):
+    # Prebuilt sample circuits, copied on each use instead of re-appending gates
+    _SAMPLE_CACHE: dict[tuple[str, int], QuantumCircuit] = {}
+
     def __init__(self):
         super().__init__()
         self.title("Quantum Transpile Suite")
@@ -17,10 +85,24 @@ class QTranspileApp(tk.Tk):
 
         self.backend_mgr = BackendManager()
         self.builder = CircuitBuilder()
+        self.cache = TranspileCache()
+        self._drawing = None
+        self._draw_lines = iter(())
         self.selected_circuit = None
         self.analysis_data = None
+        # Long-lived workers (started by the first run) keep analysis off the Tk process; results come back through _results
+        self._workers = os.cpu_count() or 1
+        self._pool = None
+        self._results = queue.Queue()
+        self._run_id = 0
+        self._run_rows = []
+        self._run_pending = set()
+        self._run_futures = []
 
         self._create_widgets()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.after(100, self._drain_results)
+        self.after(50, lambda: self.backend_mgr.refresh_ibmq(lambda found: self._results.put(('backends', None, found))))
 
     def _create_widgets(self):
         tab = ttk.Notebook(self)
@@ -59,8 +141,11 @@ class QTranspileApp(tk.Tk):
         self.circ_list.grid(row=3, column=0, columnspan=4, sticky='we')
         self.circ_list.bind('<<ListboxSelect>>', lambda e: self._select_circuit())
 
-        self.circ_display = tk.Text(frm, height=20)
+        self.circ_display = tk.Text(frm, height=20, wrap='none')
+        scroll = ttk.Scrollbar(frm, orient='vertical', command=self.circ_display.yview)
+        self.circ_display.configure(yscrollcommand=lambda lo, hi: self._on_display_scroll(scroll, lo, hi))
         self.circ_display.grid(row=4, column=0, columnspan=4, sticky='nsew')
+        scroll.grid(row=4, column=4, sticky='ns')
         frm.rowconfigure(4, weight=1)
         frm.columnconfigure(3, weight=1)
 
@@ -70,9 +155,10 @@ class QTranspileApp(tk.Tk):
 
         ttk.Label(frm, text="Backend:").grid(row=0, column=0, sticky='w')
         self.backend_var = tk.StringVar()
-        backends = list(self.backend_mgr.backends.keys())
-        ttk.Combobox(frm, textvariable=self.backend_var, values=backends, state='readonly').grid(row=0, column=1)
-        self.backend_var.set(backends[0])
+        backends = self.backend_mgr.list_backends()
+        self.backend_combo = ttk.Combobox(frm, textvariable=self.backend_var, values=tuple(backends), state='readonly')
+        self.backend_combo.grid(row=0, column=1)
+        self.backend_var.set(next(iter(backends)))
 
         ttk.Label(frm, text="Optimize Levels:").grid(row=1, column=0, sticky='w')
         self.levels_var = tk.StringVar(value="0,1,2,3")
@@ -80,11 +166,20 @@ class QTranspileApp(tk.Tk):
 
         ttk.Button(frm, text="Run Analysis", command=self._start_analysis).grid(row=0, column=2, rowspan=2, padx=10)
 
-        cols = ('Level', 'Fidelity', 'Depth', 'Size', 'Ops')
-        self.tree = ttk.Treeview(frm, columns=cols, show='headings')
-        for c in cols:
-            self.tree.heading(c, text=c)
-            self.tree.column(c, anchor='center')
+        self.gpu_var = tk.BooleanVar(value=self.backend_mgr.gpu_available)
+        ttk.Checkbutton(frm, text="GPU", variable=self.gpu_var,
+                        command=lambda: self.backend_mgr.set_gpu(self.gpu_var.get()),
+                        state='normal' if self.backend_mgr.gpu_available else 'disabled').grid(row=0, column=3)
+
+        cols = self.tree_cols = ('Level', 'Fidelity', 'Depth', 'Size', 'Ops')
+        if Sheet:
+            # Draws only the visible cells, so long result tables stay cheap to scroll
+            self.tree = Sheet(frm, headers=list(cols), data=[])
+        else:
+            self.tree = ttk.Treeview(frm, columns=cols, show='headings')
+            for c in cols:
+                self.tree.heading(c, text=c)
+                self.tree.column(c, anchor='center')
         self.tree.grid(row=2, column=0, columnspan=3, sticky='nsew')
         frm.rowconfigure(2, weight=1)
         frm.columnconfigure(2, weight=1)
@@ -98,12 +193,24 @@ class QTranspileApp(tk.Tk):
         ttk.Button(frm, text="Plot Metrics", command=self._plot_metrics).grid(row=0, column=2, padx=5)
         ttk.Button(frm, text="Plot Ops", command=self._plot_ops).grid(row=0, column=3, padx=5)
 
+    def _refresh_backend_combo(self, found):
+        self.backend_mgr.add_backends(found)
+        self.backend_combo.configure(values=tuple(self.backend_mgr.list_backends()))
+
     def _add_sample(self, name, qubits):
-        qc = QuantumCircuit(qubits)
-        qc.h(0)
-        for i in range(qubits - 1):
-            qc.cx(i, i+1)
-        qc.save_statevector()
+        template = self._SAMPLE_CACHE.get((name, qubits))
+        if template is None:
+            template = QuantumCircuit(qubits)
+            template.h(0)
+            for i in range(qubits - 1):
+                template.cx(i, i+1)
+            self._SAMPLE_CACHE[(name, qubits)] = template
+        qc = template.copy()
+        # save_statevector only makes sense for the statevector method; everything else measures
+        if AER_METHODS.get(self.backend_var.get()) == 'statevector':
+            qc.save_statevector()
+        else:
+            qc.measure_all()
         label = f"{name} #{len(self.builder._qc.qubits)+1}"
         self.builder.add_qubits(0)  # sync internal state
         self.builder._qc = qc
@@ -129,8 +236,30 @@ class QTranspileApp(tk.Tk):
         sel = self._current_selection()
         if sel:
             qc = self.builder.get_circuit()
-            self.circ_display.delete("1.0", tk.END)
-            self.circ_display.insert(tk.END, qc.draw(output="text"))
+            # The builder holds one circuit, so one cached drawing is enough; it is matched by identity
+            if self._drawing is not None and self._drawing[0] is qc:
+                self._show_drawing()
+                return
+
+            def draw():
+                text = str(qc.draw(output="text", fold=120, idle_wires=False))
+                self._results.put(('drawing', None, (qc, text.splitlines(keepends=True))))
+
+            threading.Thread(target=draw, daemon=True).start()
+
+    def _show_drawing(self):
+        self.circ_display.delete("1.0", tk.END)
+        self._draw_lines = iter(self._drawing[1])
+        self._append_drawing_page()
+
+    def _append_drawing_page(self, page=200):
+        # Only materialise as many lines as the user has scrolled towards
+        self.circ_display.insert(tk.END, "".join(itertools.islice(self._draw_lines, page)))
+
+    def _on_display_scroll(self, scroll, lo, hi):
+        scroll.set(lo, hi)
+        if float(hi) > 0.9:
+            self._append_drawing_page()
 
     def _refresh_list(self):
         self.circ_list.delete(0, tk.END)
@@ -151,19 +280,145 @@ class QTranspileApp(tk.Tk):
             messagebox.showerror("Invalid input", "Enter levels as 0,1,2")
             return
 
-        backend = self.backend_mgr.set_backend(self.backend_var.get())
-        qc = self.builder.get_circuit()
-        self.tree.delete(*self.tree.get_children())
+        # A new run supersedes the previous one, including any batches it still has queued
+        self._abort_run()
+        self._run_rows = []
+        self.analysis_data = None
+        self._populate_tree([])
+        args = (self._run_id, self.builder.get_circuit(), self.backend_var.get(), levels, self.gpu_var.get())
+        threading.Thread(target=self._prepare_run, args=args, daemon=True).start()
 
-        def task():
-            results = analyze_transpile(qc, backend, levels, default_pass_manager(backend.configuration().basis_gates))
-            self.analysis_data = results
-            for r in results:
-                self.tree.insert("", tk.END, values=(
-                    r['level'], f"{r['fidelity']:.6f}", r['depth'], r['size'], str(r['ops'])
-                ))
+    def _prepare_run(self, run_id, qc, backend_name, levels, gpu):
+        # Backend lookup, calibration and cache reads can hit the network or disk, so they stay off the Tk thread
+        try:
+            config = self.backend_mgr.set_backend(backend_name).configuration()
+            if config.simulator:
+                levels = [0]
+            # Single-precision GPU runs can differ from CPU ones, so keep their rows apart
+            cache_name = f"{backend_name} [GPU]" if gpu and config.simulator else backend_name
+            calibration = self.backend_mgr.calibration_stamp(backend_name)
+            keys = {level: TranspileCache.make_key(qc, cache_name, calibration, level) for level in levels}
+            cached = {level: self.cache.get(key) for level, key in keys.items()}
+        except Exception as e:
+            self._results.put(('error', run_id, e))
+            return
+        rows = [r for r in cached.values() if r is not None]
+        pending = sorted(level for level, r in cached.items() if r is None)
+        job = (qc, backend_name, config.basis_gates, config.simulator, gpu)
+        self._results.put(('prepared', run_id, (keys, rows, pending, job)))
+
+    def _submit_run(self, keys, rows, pending, job):
+        self._run_rows = rows
+        if not pending:
+            self._finish_analysis()
+            return
+        self._run_pending = set(pending)
+        qc, backend_name, basis_gates, simulator, gpu = job
+        if self._pool is None:
+            # Spawn rather than fork: this process holds a Tk connection and helper threads.
+            # Spawned workers share nothing with us, so they warm their own pass managers.
+            gate_sets = () if simulator else (tuple(sorted(basis_gates)),)
+            self._pool = ProcessPoolExecutor(max_workers=self._workers, mp_context=multiprocessing.get_context("spawn"),
+                                             initializer=_init_worker,
+                                             initargs=(self.backend_mgr.credentials, self.backend_mgr.gpu_available, gate_sets))
+        # Levels are independent: split them into one batch per worker and run the batches side by side
+        pool = self._pool
+        n = min(len(pending), self._workers)
+        try:
+            for chunk in (pending[i::n] for i in range(n)):
+                fut = pool.submit(_run_levels, qc, backend_name, chunk, basis_gates, simulator, gpu)
+                fut.add_done_callback(functools.partial(self._post_result, pool, self._run_id, keys, chunk))
+                self._run_futures.append(fut)
+        except BrokenProcessPool as e:
+            self._results.put(('broken', self._run_id, (pool, e)))
+
+    def _post_result(self, pool, run_id, keys, levels, fut):
+        # Runs on the executor's thread, so the cache write stays off the Tk thread as well
+        if fut.cancelled():
+            return
+        try:
+            rows = fut.result()
+        except BrokenProcessPool as e:
+            self._results.put(('broken', run_id, (pool, e)))
+            return
+        except Exception as e:
+            self._results.put(('error', run_id, e))
+            return
+        for r in rows:
+            self.cache.put(keys[r['level']], r)
+        self._results.put(('levels', run_id, (levels, rows)))
 
-        threading.Thread(target=task, daemon=True).start()
+    def _drain_results(self):
+        try:
+            while True:
+                kind, run_id, payload = self._results.get_nowait()
+                if kind == 'drawing':
+                    # Ignore drawings of a circuit the builder has since replaced
+                    if payload[0] is self.builder.get_circuit():
+                        self._drawing = payload
+                        self._show_drawing()
+                    continue
+                if kind == 'backends':
+                    self._refresh_backend_combo(payload)
+                    continue
+                if kind == 'broken':
+                    # A dead worker breaks the executor for good; drop it so the next run starts a fresh one
+                    pool, payload = payload
+                    if pool is self._pool:
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        self._pool = None
+                    kind = 'error'
+                if run_id != self._run_id:
+                    continue
+                if kind == 'prepared':
+                    self._submit_run(*payload)
+                elif kind == 'error':
+                    self._abort_run()
+                    messagebox.showerror("Analysis failed", str(payload))
+                elif kind == 'levels':
+                    levels, rows = payload
+                    if not self._run_pending.intersection(levels):
+                        continue
+                    self._run_rows.extend(rows)
+                    self._run_pending.difference_update(levels)
+                    if not self._run_pending:
+                        self._finish_analysis()
+        except queue.Empty:
+            pass
+        finally:
+            self.after(100, self._drain_results)
+
+    def _abort_run(self):
+        # Cancel queued batches and move to a new run id so anything still in flight is ignored
+        for fut in self._run_futures:
+            fut.cancel()
+        self._run_futures = []
+        self._run_pending = set()
+        self._run_id += 1
+
+    def _finish_analysis(self):
+        results = sorted(self._run_rows, key=lambda r: r['level'])
+        self.analysis_data = results
+        fids = np.fromiter((r['fidelity'] for r in results), dtype=np.float64, count=len(results))
+        rows = [(r['level'], fid, r['depth'], r['size'], str(r['ops']))
+                for r, fid in zip(results, np.char.mod('%.6f', fids).tolist())]
+        self._populate_tree(rows)
+
+    def _on_close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def _populate_tree(self, rows):
+        if Sheet:
+            self.tree.set_sheet_data([list(row) for row in rows])
+            return
+        self.tree.delete(*self.tree.get_children())
+        # Hide the columns while inserting so Tk redraws once rather than per row
+        self.tree.configure(displaycolumns=())
+        for row in rows:
+            self.tree.insert("", tk.END, values=row)
+        self.tree.configure(displaycolumns=self.tree_cols)
 
     def _save_csv(self):
         if not self.analysis_data: